@@ -110,8 +110,7 @@ def cash_flow_volatility(cfo, years):
 
 def operating_leverage_cash(cfo, revenue, years):
     lev = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i - 1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         cfo_g = (cfo[y1] - cfo[y0]) / abs(cfo[y0])
         rev_g = (revenue[y1] - revenue[y0]) / revenue[y0]
         lev[y1] = cfo_g / rev_g if rev_g != 0 else None
@@ -80,8 +80,8 @@ def financial_leverage(assets, equity):
     return {y: assets[y] / equity[y] for y in assets}
 
 def net_asset_growth(nav, years):
-    return {years[i]: (nav[years[i]] - nav[years[i-1]]) / nav[years[i-1]]
-            for i in range(1, len(years))}
+    return {y1: (nav[y1] - nav[y0]) / nav[y0]
+            for y0, y1 in zip(years, years[1:])}
 
 def defensive_interval_ratio(cash, receivables, daily_expenses):
     return {y: (cash[y] + receivables[y]) / daily_expenses[y] for y in cash}
@@ -120,8 +120,8 @@ def retained_earnings_ratio(retained, equity):
     return {y: retained[y] / equity[y] for y in equity}
 
 def shareholder_dilution_risk(shares, years):
-    return {years[i]: (shares[years[i]] - shares[years[i-1]]) / shares[years[i-1]]
-            for i in range(1, len(years))}
+    return {y1: (shares[y1] - shares[y0]) / shares[y0]
+            for y0, y1 in zip(years, years[1:])}
 
 def net_operating_assets(op_assets, op_liabilities):
     return {y: op_assets[y] - op_liabilities[y] for y in op_assets}
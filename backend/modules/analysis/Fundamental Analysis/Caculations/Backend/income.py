@@ -1,3 +1,5 @@
+import statistics
+
 # =====================================================
 # LOAD COMPANY DATA
 # =====================================================
@@ -13,8 +15,7 @@ def load_data(path):
 # =====================================================
 def revenue_growth(revenue, years):
     growth = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i-1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         growth[y1] = (revenue[y1] - revenue[y0]) / revenue[y0]
     return growth
 
@@ -77,8 +78,7 @@ def cost_structure(cogs, rd, sga, revenue):
 
 def operating_leverage(ebit, revenue, years):
     ol = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i-1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         ebit_growth = (ebit[y1] - ebit[y0]) / abs(ebit[y0])
         rev_growth = (revenue[y1] - revenue[y0]) / revenue[y0]
         ol[y1] = ebit_growth / rev_growth if rev_growth != 0 else None
@@ -96,15 +96,13 @@ def break_even_revenue(rd, sga, contribution_margin):
 
 def earnings_growth(net_income, years):
     growth = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i-1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         growth[y1] = (net_income[y1] - net_income[y0]) / net_income[y0]
     return growth
 
 def ebit_vs_revenue_growth(ebit, revenue, years):
     diff = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i-1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         ebit_g = (ebit[y1] - ebit[y0]) / abs(ebit[y0])
         rev_g = (revenue[y1] - revenue[y0]) / revenue[y0]
         diff[y1] = ebit_g - rev_g
@@ -112,8 +110,7 @@ def ebit_vs_revenue_growth(ebit, revenue, years):
 
 def expense_elasticity(rd, sga, revenue, years):
     elasticity = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i-1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         exp0 = rd[y0] + sga[y0]
         exp1 = rd[y1] + sga[y1]
         exp_growth = (exp1 - exp0) / exp0
@@ -128,16 +125,13 @@ def normalized_earnings(net_income):
     avg = sum(net_income.values()) / len(net_income)
     return avg
 
-import statistics
-
 def earnings_volatility(earnings_growth):
     values = [v for v in earnings_growth.values() if v is not None]
     return statistics.stdev(values) if len(values) > 1 else 0
 
 def operating_margin_trend(op_margin, years):
     trend = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i-1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         trend[y1] = op_margin[y1] - op_margin[y0]
     return trend
 
@@ -148,8 +142,7 @@ def pricing_power_indicator(gross_margin):
 
 def cost_inflation_absorption(gross_margin, years):
     absorption = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i-1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         gm0 = gross_margin.get(y0)
         gm1 = gross_margin.get(y1)
         absorption[y1] = (gm1 - gm0) if (gm0 is not None and gm1 is not None) else None
@@ -165,15 +158,13 @@ def earnings_quality_score(accrual, volatility, margin_trend):
 
 def incremental_margin(op, revenue, years):
     inc = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i-1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         inc[y1] = (op[y1] - op[y0]) / (revenue[y1] - revenue[y0])
     return inc
 
 def incremental_ebitda_margin(ebitda, revenue, years):
     inc = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i-1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         inc[y1] = (ebitda[y1] - ebitda[y0]) / (revenue[y1] - revenue[y0])
     return inc
 
@@ -197,8 +188,7 @@ def depreciation_intensity(dep, revenue):
 
 def earnings_sensitivity_to_costs(cogs, revenue, years):
     sensitivity = {}
-    for i in range(1, len(years)):
-        y0, y1 = years[i-1], years[i]
+    for y0, y1 in zip(years, years[1:]):
         cost_growth = (cogs[y1] - cogs[y0]) / cogs[y0]
         rev_growth = (revenue[y1] - revenue[y0]) / revenue[y0]
         sensitivity[y1] = cost_growth - rev_growth
@@ -219,7 +209,6 @@ def growth_persistence_index(revenue_growth):
     return sum(vals) / len(vals) if vals else 0
 
 def margin_stability_score(op_margin):
-    import statistics
     vals = list(op_margin.values())
     return 1 / statistics.stdev(vals) if len(vals) > 1 else 0
 
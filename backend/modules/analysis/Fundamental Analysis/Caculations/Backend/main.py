@@ -2,7 +2,6 @@
 # MAIN
 # =====================================================
 
-import math
 from income import *
 from fposition import *
 from cashflow import *
@@ -10,43 +9,45 @@ from cashflow import *
 # =====================================================
 # OUTPUT
 # =====================================================
+def write_year_values(lines, years, values):
+    for y in years:
+        val = values.get(y)
+        if val is None:
+            lines.append(f"{y}: N/A\n")
+        elif isinstance(val, (int, float)):
+            lines.append(f"{y}: {round(val, 4)}\n")
+        else:
+            lines.append(f"{y}: {val}\n")
+
+
 def write_output(company, years, results):
     fname = company.replace(" ", "_") + "_income_analysis.txt"
-    with open(fname, "w", encoding="utf-8") as f:
-        for name, values in results.items():
-            f.write(f"\n{name}\n")
-            f.write("-" * len(name) + "\n")
+    # Build the whole report first, then write it in one go
+    lines = []
+    for name, values in results.items():
+        lines.append(f"\n{name}\n")
+        lines.append("-" * len(name) + "\n")
+        if isinstance(values, dict):
             # Nested dicts (e.g., cost structure)
-            if isinstance(values, dict) and all(isinstance(v, dict) for v in values.values()):
+            if all(isinstance(v, dict) for v in values.values()):
                 for sub, subvals in values.items():
-                    f.write(f"\n{sub}\n")
-                    for y in years:
-                        val = subvals.get(y)
-                        if val is None:
-                            f.write(f"{y}: N/A\n")
-                        elif isinstance(val, (int, float)):
-                            f.write(f"{y}: {round(val, 4)}\n")
-                        else:
-                            f.write(f"{y}: {val}\n")
+                    lines.append(f"\n{sub}\n")
+                    write_year_values(lines, years, subvals)
 
             # Dicts keyed by year (e.g., margins, growth rates)
-            elif isinstance(values, dict):
-                for y in years:
-                    val = values.get(y)
-                    if val is None:
-                        f.write(f"{y}: N/A\n")
-                    elif isinstance(val, (int, float)):
-                        f.write(f"{y}: {round(val, 4)}\n")
-                    else:
-                        f.write(f"{y}: {val}\n")
-
-            # Scalar values (e.g., volatility, pricing_power, scores)
-            elif isinstance(values, (int, float)):
-                f.write(f"{round(values, 4)}\n")
-
-            # Fallback for other types
             else:
-                f.write(f"{values}\n")
+                write_year_values(lines, years, values)
+
+        # Scalar values (e.g., volatility, pricing_power, scores)
+        elif isinstance(values, (int, float)):
+            lines.append(f"{round(values, 4)}\n")
+
+        # Fallback for other types
+        else:
+            lines.append(f"{values}\n")
+
+    with open(fname, "w", encoding="utf-8") as f:
+        f.write("".join(lines))
 
     print("Saved:", fname)
 
@@ -17,29 +17,31 @@ def write_output(company, results):
     # Append consolidated analysis to the shared analysis file (don't overwrite)
     fname = "../ABC_Corp_income_analysis.txt"
     sep = "\n\n=== Analysis appended: " + datetime.utcnow().isoformat() + " UTC ===\n"
-    with open(fname, "a", encoding="utf-8") as f:
-        f.write(sep)
-        f.write(f"Company: {company}\n")
+    lines = [sep, f"Company: {company}\n"]
+
+    # results currently maps year -> {metric: value, ...}
+    # invert it to metric -> {year: value}
+    years = sorted(results)
+    # collect metric names from first year's dict (if any)
+    sample = results[years[0]] if years else {}
+    metric_names = list(sample) if isinstance(sample, dict) else []
+    # resolve each year's metric dict once instead of per metric
+    year_rows = [(y, results.get(y, {}) or {}) for y in years]
 
-        # results currently maps year -> {metric: value, ...}
-        # invert it to metric -> {year: value}
-        years = sorted(results.keys())
-        # collect metric names from first year's dict (if any)
-        sample = results[years[0]] if years else {}
-        metric_names = list(sample.keys()) if isinstance(sample, dict) else []
+    for metric in metric_names:
+        lines.append(f"\n{metric}\n")
+        lines.append("-" * len(metric) + "\n")
+        for y, year_vals in year_rows:
+            val = year_vals.get(metric)
+            if val is None:
+                lines.append(f"{y}: N/A\n")
+            elif isinstance(val, float):
+                lines.append(f"{y}: {round(val, 4)}\n")
+            else:
+                lines.append(f"{y}: {val}\n")
 
-        for metric in metric_names:
-            f.write(f"\n{metric}\n")
-            f.write("-" * len(metric) + "\n")
-            for y in years:
-                year_vals = results.get(y, {}) or {}
-                val = year_vals.get(metric)
-                if val is None:
-                    f.write(f"{y}: N/A\n")
-                elif isinstance(val, float):
-                    f.write(f"{y}: {round(val, 4)}\n")
-                else:
-                    f.write(f"{y}: {val}\n")
+    with open(fname, "a", encoding="utf-8") as f:
+        f.write("".join(lines))
     print("Appended:", fname)
 
 # =========================
@@ -64,12 +66,14 @@ if __name__ == "__main__":
 
     # Calculate total debt first
     total_debt_dict = {y: d["short_term_debt"][y] + d["long_term_debt"][y] for y in d["years"]}
+    price = d["market_price"]
 
     for y in d["years"]:
-        eps_v = eps(d["net_income"][y], d["shares_outstanding"][y])
-        bvps_v = bvps(d["equity"][y], d["shares_outstanding"][y])
-        price = d["market_price"]
-        mcap = market_cap(price, d["shares_outstanding"][y])
+        shares = d["shares_outstanding"][y]
+        revenue = d["revenue"][y]
+        eps_v = eps(d["net_income"][y], shares)
+        bvps_v = bvps(d["equity"][y], shares)
+        mcap = market_cap(price, shares)
         ev = enterprise_value(mcap, total_debt_dict[y], d["cash"][y])
 
         results[y] = {
@@ -77,12 +81,12 @@ if __name__ == "__main__":
             "Market Capitalization": mcap,
             "P/E Ratio": pe_ratio(price, eps_v),
             "P/B Ratio": pb_ratio(price, bvps_v),
-            "P/S Ratio": ps_ratio(price, d["revenue"][y], d["shares_outstanding"][y]),
+            "P/S Ratio": ps_ratio(price, revenue, shares),
             "Earnings Yield": earnings_yield(eps_v, price),
             "Enterprise Value": ev,
             "EV / EBITDA": ev_ebitda(ev, d["ebitda"][y]),
             "EV / EBIT": ev_ebit(ev, d["ebit"][y]),
-            "EV / Sales": ev_sales(ev, d["revenue"][y]),
+            "EV / Sales": ev_sales(ev, revenue),
         }
 
     write_output(d["company_name"], results)
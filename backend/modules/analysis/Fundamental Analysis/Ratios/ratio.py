@@ -30,18 +30,6 @@ def ev_sales(ev, revenue):
     return ev / revenue
 
 
-# =====================================================
-# PER SHARE
-# =====================================================
-
-def eps(net_income, shares):
-    return net_income / shares
-
-def bvps(equity, shares):
-    return equity / shares
-
-
-
 # =====================================================
 # RETURN RATIOS (CROSS-STATEMENT)
 # =====================================================
@@ -17,19 +17,20 @@ def write_output(company, results):
     fname = "../ABC_Corp_income_analysis.txt"
     sep = "\n\n=== Valuation Analysis appended: " + datetime.utcnow().isoformat() + " UTC ===\n"
 
-    with open(fname, "a", encoding="utf-8") as f:
-        f.write(sep)
-        f.write(f"Company: {company}\n")
+    lines = [sep, f"Company: {company}\n"]
+
+    years = sorted(results)
+    metrics = results[years[0]].keys()
 
-        years = sorted(results.keys())
-        metrics = results[years[0]].keys()
+    for metric in metrics:
+        lines.append(f"\n{metric}\n")
+        lines.append("-" * len(metric) + "\n")
+        for y in years:
+            val = results[y][metric]
+            lines.append(f"{y}: {round(val, 4) if isinstance(val, float) else val}\n")
 
-        for metric in metrics:
-            f.write(f"\n{metric}\n")
-            f.write("-" * len(metric) + "\n")
-            for y in years:
-                val = results[y][metric]
-                f.write(f"{y}: {round(val, 4) if isinstance(val, float) else val}\n")
+    with open(fname, "a", encoding="utf-8") as f:
+        f.write("".join(lines))
 
     print("Valuation appended:", fname)
 
@@ -41,12 +42,27 @@ if __name__ == "__main__":
     d = load_data("../ABC_Corp_income.txt")
     results = {}
 
-    for y in d["years"]:
-        # --- working capital and delta ---
-        wc = {yr: d.get("current_assets", {}).get(yr, 0) - d.get("current_liabilities", {}).get(yr, 0) for yr in d["years"]}
-        delta_wc = delta_working_capital(wc, d["years"])
+    # --- working capital and delta (same for every year, compute once) ---
+    wc = {yr: d.get("current_assets", {}).get(yr, 0) - d.get("current_liabilities", {}).get(yr, 0) for yr in d["years"]}
+    delta_wc = delta_working_capital(wc, d["years"])
+
+    # --- FCFF dict and multi-year DCF firm value ---
+    tax_dict = {yr: d.get("tax_rate", 0) for yr in d["years"]}
+    fcff_dict = fcff(d.get("ebit", {}), tax_dict, d.get("depreciation", {}), d.get("capex", {}), delta_wc)
+    firm_val_from_dict = firm_value(fcff_dict, d["wacc"], d["terminal_growth"]) if fcff_dict else None
+
+    # --- FCFE dict and its multi-year DCF value ---
+    raw_net_borrowing = d.get("net_borrowing", {})
+    net_borrowing_dict = {yr: raw_net_borrowing.get(yr, 0) for yr in d["years"]}
+    fcfe_dict = fcfe(d.get("net_income", {}), d.get("depreciation", {}), d.get("capex", {}), delta_wc, net_borrowing_dict)
+    total_fcfe_value = fcfe_dcf(fcfe_dict, d.get("cost_of_equity", 0), d.get("terminal_growth", 0)) if fcfe_dict else None
 
-        # --- FCFF (scalar and dict) ---
+    market_price = d.get("market_price", 0)
+
+    for y in d["years"]:
+        cash_y = d.get("cash", {}).get(y, 0)
+        total_liabilities_y = d.get("total_liabilities", {}).get(y, 0)
+        # --- FCFF (scalar) ---
         fcff_scalar = calc_fcff(
             d["ebit"][y],
             d["tax_rate"],
@@ -55,20 +71,15 @@ if __name__ == "__main__":
             delta_wc.get(y, 0)
         )
 
-        tax_dict = {yr: d.get("tax_rate", 0) for yr in d["years"]}
-        fcff_dict = fcff(d.get("ebit", {}), tax_dict, d.get("depreciation", {}), d.get("capex", {}), delta_wc)
-
         firm_val = dcf_firm_value(
             fcff_scalar,
             d["wacc"],
             d["terminal_growth"]
         )
 
-        # firm value from the FCFF dict (multi-year DCF)
-        firm_val_from_dict = firm_value(fcff_dict, d["wacc"], d["terminal_growth"]) if fcff_dict else None
         total_debt_y = d.get("total_debt", {}).get(y,
                      d.get("short_term_debt", {}).get(y, 0) + d.get("long_term_debt", {}).get(y, 0))
-        equity_val = firm_val - (total_debt_y - d.get("cash", {}).get(y, 0))
+        equity_val = firm_val - (total_debt_y - cash_y)
 
         intrinsic_price = equity_val / d["shares_outstanding"][y]
 
@@ -80,13 +91,9 @@ if __name__ == "__main__":
             d.get("net_borrowing", {}).get(y, 0)
         )
 
-        # FCFE dict and per-share (dict-based)
-        raw_net_borrowing = d.get("net_borrowing", {})
-        net_borrowing_dict = {yr: raw_net_borrowing.get(yr, 0) for yr in d["years"]}
-        fcfe_dict = fcfe(d.get("net_income", {}), d.get("depreciation", {}), d.get("capex", {}), delta_wc, net_borrowing_dict)
+        # FCFE per-share (dict-based)
         fcfe_per_share_dict = None
-        if fcfe_dict:
-            total_fcfe_value = fcfe_dcf(fcfe_dict, d.get("cost_of_equity", 0), d.get("terminal_growth", 0))
+        if total_fcfe_value is not None:
             fcfe_per_share_dict = total_fcfe_value / d.get("shares_outstanding", {}).get(y, 1)
 
         fcfe_value = fcfe_dcf(
@@ -95,7 +102,6 @@ if __name__ == "__main__":
             d["terminal_growth"]
         ) / d["shares_outstanding"][y]
 
-        cash_y = d.get("cash", {}).get(y, 0)
         net_debt_y = total_debt_y - cash_y
 
         # Additional metrics using functions in value.py
@@ -114,11 +120,11 @@ if __name__ == "__main__":
         ddm = ddm_gordon(dividend_per_share, d.get("cost_of_equity", 0.0), d.get("terminal_growth", 0.0)) if dividend_per_share > 0 else None
 
         residual_inc = residual_income(d.get("net_income", {}).get(y, 0), d.get("equity", {}).get(y, 0), d.get("cost_of_equity", 0))
-        adj_nav = adjusted_nav(d.get("total_assets", {}).get(y, 0), d.get("total_liabilities", {}).get(y, 0))
-        liq_value = liquidation_value(d.get("cash", {}).get(y, 0), d.get("total_liabilities", {}).get(y, 0))
-        mos = margin_of_safety(intrinsic_price, d.get("market_price", 0)) if d.get("market_price", 0) else None
+        adj_nav = adjusted_nav(d.get("total_assets", {}).get(y, 0), total_liabilities_y)
+        liq_value = liquidation_value(cash_y, total_liabilities_y)
+        mos = margin_of_safety(intrinsic_price, market_price) if market_price else None
         safe_price = safe_buy_price(intrinsic_price, 0.2) if intrinsic_price else None
-        expected_ret = expected_annual_return(intrinsic_price, d.get("market_price", 0), 1) if d.get("market_price", 0) else None
+        expected_ret = expected_annual_return(intrinsic_price, market_price, 1) if market_price else None
 
         epv = earnings_power_value(
             d["normalized_ebit"],
@@ -1,13 +1,11 @@
-import math
-
 # =========================
 # CASH FLOW CALCULATIONS
 # =========================
 
 def delta_working_capital(wc, years):
     return {
-        years[i]: wc[years[i]] - wc[years[i-1]]
-        for i in range(1, len(years))
+        y1: wc[y1] - wc[y0]
+        for y0, y1 in zip(years, years[1:])
     }
 
 def fcff(ebit, tax, dep, capex, delta_wc):